@@ -1,11 +1,17 @@
 from ninja import NinjaAPI, Schema
-from typing import List, Dict, Any
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from pydantic import Field, RootModel
+from pydantic import Field
 
 from .services import DatasetService
 
+try:
+    # orjson parses JSON in C, ~3-5x faster than the stdlib for the large
+    # row payloads this endpoint receives.
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as json_loads
+
 
 api = NinjaAPI(
     title="Santo Request API",
@@ -13,57 +19,6 @@ api = NinjaAPI(
     description="API dinámica para crear tablas en PostgreSQL y servirlas via PostgREST"
 )
 
-class CreateDatasetRequest(RootModel[Dict[str, List[Dict[str, Any]]]]):
-    """
-    Solicitud para crear un dataset dinámico.
-    
-    El JSON debe tener una única clave que será el nombre de la tabla,
-    y el valor debe ser un array de objetos con los datos.
-    
-    ```json
-    {
-        "nombre_tabla": [
-            {"col1": "val1", "col2": "val2"},
-            {"col1": "val3", "col2": "val4"}
-        ]
-    }
-    ```
-    
-    **Ejemplo:**
-    ```json
-    {
-        "tutifruti": [
-            {"letra": "A", "comida": "Asado", "pais": "Argentina", "nombre": "Alejandro", "animal": "Ardilla"},
-            {"letra": "B", "comida": "Brocoli", "pais": "Brasil", "nombre": "Bruno", "animal": "Búfalo"},
-            {"letra": "C", "comida": "Canelones", "pais": "Chile", "nombre": "Carla", "animal": "Cocodrilo"}
-        ]
-    }
-    ```
-    
-    **La clave principal del JSON será el nombre de la tabla.**
-    **Los objetos del array definen las columnas y datos.**
-    
-    **Validaciones:**
-    - Debe contener exactamente una tabla
-    - Nombre de tabla: Solo alfanumérico y guiones bajos `[a-zA-Z0-9_]`
-    - Nombres de columnas: Solo alfanumérico y guiones bajos `[a-zA-Z0-9_]`
-    - Los datos no pueden estar vacíos
-    - Todas las filas deben tener las mismas columnas
-    """
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "tutifruti": [
-                    {"letra": "A", "comida": "Asado", "pais": "Argentina", "nombre": "Alejandro", "animal": "Ardilla"},
-                    {"letra": "B", "comida": "Brocoli", "pais": "Brasil", "nombre": "Bruno", "animal": "Búfalo"},
-                    {"letra": "C", "comida": "Canelones", "pais": "Chile", "nombre": "Carla", "animal": "Cocodrilo"}
-                ]
-            }
-        }
-    }
-
-
 class CreateDatasetResponse(Schema):
     """Respuesta exitosa al crear un dataset."""
     message: str = Field(..., description="Mensaje de confirmación")
@@ -127,22 +82,39 @@ class ErrorResponse(Schema):
     """,
     tags=["Dataset Management"]
 )
-def create_dataset(request, payload: CreateDatasetRequest):
+def create_dataset(request):
     """
     Create or update dynamic datasets in PostgreSQL.
 
     Accept the format specified in the Challenge where the JSON key is
     the table name and the value is the data array.
 
+    Parse the body straight from request.body (orjson when available):
+    the generic pydantic walk over Dict[str, List[Dict[str, Any]]] only
+    duplicated validation that DatasetService performs anyway.
+
     Delegate all business logic to DatasetService.
     """
     try:
-        # Initialize service with the request data
-        service = DatasetService(payload.root)
-        
-        # Execute business logic
-        table_name, rows_inserted = service.create_or_update_dataset()
-        
+        table_data = json_loads(request.body)
+    except ValueError:
+        return 400, ErrorResponse(error="Request body is not valid JSON")
+
+    if not isinstance(table_data, dict):
+        return 400, ErrorResponse(error="Request body must be a JSON object")
+
+    # Validate as pure Python before the DB phase: bad payloads are
+    # rejected without ever opening a transaction or cursor.
+    service = DatasetService(table_data)
+    try:
+        service.validate()
+    except ValidationError as e:
+        return 400, ErrorResponse(error=str(e))
+
+    try:
+        # Execute the database phase
+        table_name, rows_inserted = service.persist()
+
         # Get PostgREST URL from settings or use default
         postgrest_url = getattr(settings, 'POSTGREST_URL', 'http://localhost:3000')
         
@@ -155,7 +127,7 @@ def create_dataset(request, payload: CreateDatasetRequest):
         )
     
     except ValidationError as e:
-        # Handle validation errors (400 Bad Request)
+        # Column mismatch against the existing table (400 Bad Request)
         return 400, ErrorResponse(error=str(e))
     
     except Exception as e:
@@ -0,0 +1,126 @@
+"""
+Shared fixtures for the api test suite.
+
+Shared payload data is wrapped in MappingProxyType: DatasetService only
+reads its input, so a single read-only mapping can be shared across the
+whole run instead of being rebuilt per test.
+"""
+
+from types import MappingProxyType
+
+import pytest
+from django.db import connection
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from api.services import DatasetService
+
+
+# Tables the service created this session; teardown drops exactly these
+# instead of scanning pg_tables for candidates.
+_created_tables: set = set()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def drop_leftover_test_tables(django_db_blocker):
+    """
+    Track service-created tables and drop them once at session end.
+
+    DatasetService.persist is wrapped for the session so every table a
+    test creates lands in _created_tables. SAVEPOINT-isolated tests clean
+    up after themselves, but the API tests run with transaction=True and
+    really commit their dynamic tables; with --reuse-db those would
+    otherwise accumulate across sessions. One aggregated DROP at teardown
+    (IF EXISTS covers the rolled-back ones) replaces both the old
+    per-test cleanup loop and its pg_tables catalog scan.
+    """
+    original_persist = DatasetService.persist
+
+    def recording_persist(self):
+        result = original_persist(self)
+        _created_tables.add(result[0])
+        return result
+
+    DatasetService.persist = recording_persist
+    try:
+        yield
+    finally:
+        DatasetService.persist = original_persist
+
+    if not _created_tables:
+        return
+    with django_db_blocker.unblock():
+        if not connection.settings_dict['NAME'].startswith('test_'):
+            # Not on the test database: nothing safe to drop.
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
+                sql.SQL(", ").join(
+                    sql.Identifier(table) for table in sorted(_created_tables)
+                )
+            ))
+
+
+@pytest.fixture
+def db_cursor():
+    """
+    Yield one cursor shared by the whole test.
+
+    Saves the CursorWrapper allocation each `with connection.cursor()`
+    block costs; the cursor lives inside the test's atomic wrapper, so
+    sharing it is safe.
+    """
+    with connection.cursor() as cursor:
+        yield cursor
+
+
+@pytest.fixture
+def seed_rows():
+    """
+    Return a callable that bulk-loads fixture rows with one statement.
+
+    Pre-seeding table state through execute_values keeps big fixtures to a
+    single round-trip instead of one INSERT per row.
+    """
+    def _seed_rows(cursor, table, columns, rows):
+        query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(sql.Identifier(col) for col in columns)
+        )
+        execute_values(cursor.cursor, query.as_string(cursor.cursor), rows)
+    return _seed_rows
+
+
+@pytest.fixture
+def column_names():
+    """
+    Return a callable listing a table's column names via pg_catalog.
+
+    Queries pg_attribute directly instead of information_schema.columns,
+    which is a many-join view over the catalogs and far slower for the
+    simple "what columns does this table have" question the tests ask.
+    """
+    def _column_names(cursor, table):
+        cursor.execute(
+            """
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = %s::regclass
+              AND attnum > 0
+              AND NOT attisdropped
+            ORDER BY attname
+            """,
+            [table]
+        )
+        return [row[0] for row in cursor.fetchall()]
+    return _column_names
+
+
+# Shared as a module constant too so parametrized tests can reference the
+# payload directly (parametrize cannot take fixtures).
+TUTIFRUTI_DATA = MappingProxyType({
+    "tutifruti": [
+        {"letra": "A", "comida": "Asado", "pais": "Argentina", "nombre": "Alejandro", "animal": "Ardilla"},
+        {"letra": "B", "comida": "Brocoli", "pais": "Brasil", "nombre": "Bruno", "animal": "Búfalo"},
+        {"letra": "C", "comida": "Canelones", "pais": "Chile", "nombre": "Carla", "animal": "Cocodrilo"}
+    ]
+})
@@ -151,7 +151,7 @@ def test_create_dataset_internal_error_500(client, valid_payload):
     # Mock the service to raise an unexpected exception
     with patch('api.api.DatasetService') as MockService:
         mock_instance = MagicMock()
-        mock_instance.create_or_update_dataset.side_effect = Exception("Unexpected database connection error")
+        mock_instance.persist.side_effect = Exception("Unexpected database connection error")
         MockService.return_value = mock_instance
         
         response = client.post(
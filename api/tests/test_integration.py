@@ -1,46 +1,60 @@
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import connection
+from psycopg2 import sql
 
 from api.services import DatasetService
+from api.tests.conftest import TUTIFRUTI_DATA
 
-@pytest.fixture
-def tutifruti_data():
-    """Fixture providing the challenge example data."""
-    return {
-        "tutifruti": [
-            {"letra": "A", "comida": "Asado", "pais": "Argentina", "nombre": "Alejandro", "animal": "Ardilla"},
-            {"letra": "B", "comida": "Brocoli", "pais": "Brasil", "nombre": "Bruno", "animal": "Búfalo"},
-            {"letra": "C", "comida": "Canelones", "pais": "Chile", "nombre": "Carla", "animal": "Cocodrilo"}
-        ]
-    }
+WORKFLOW_DATA = {
+    "test_workflow": [
+        {"letra": "A", "comida": "Asado", "pais": "Argentina"},
+        {"letra": "B", "comida": "Brocoli", "pais": "Brasil"},
+        {"letra": "C", "comida": "Canelones", "pais": "Chile"}
+    ]
+}
 
+USERS_DATA = {
+    "test_users": [
+        {"name": "John", "email": "john@example.com"},
+        {"name": "Jane", "email": "jane@example.com"}
+    ]
+}
 
-@pytest.mark.django_db(transaction=True)
-def test_full_workflow_new_table():
-    """Test complete workflow for creating a new table."""
-    data = {
-        "test_workflow": [
-            {"letra": "A", "comida": "Asado", "pais": "Argentina"},
-            {"letra": "B", "comida": "Brocoli", "pais": "Brasil"},
-            {"letra": "C", "comida": "Canelones", "pais": "Chile"}
-        ]
-    }
-    service = DatasetService(data)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("payload,table,expected_rows,first_row", [
+    (WORKFLOW_DATA, "test_workflow", 3, ("A", "Asado", "Argentina")),
+    (TUTIFRUTI_DATA, "tutifruti", 3,
+     ("A", "Asado", "Argentina", "Alejandro", "Ardilla")),
+    (USERS_DATA, "test_users", 2, ("John", "john@example.com")),
+], ids=["workflow", "tutifruti", "users"])
+def test_create_dataset_success(payload, table, expected_rows, first_row,
+                                db_cursor, column_names):
+    """One success-path test: table created, counts returned, data round-trips."""
+    service = DatasetService(payload)
     table_name, rows_inserted = service.create_or_update_dataset()
-    
-    assert table_name == "test_workflow"
-    assert rows_inserted == 3
-    
-    with connection.cursor() as cursor:
-        cursor.execute('SELECT letra, comida, pais FROM "test_workflow" ORDER BY id')
-        rows = cursor.fetchall()
-        assert len(rows) == 3
-        assert rows[0] == ("A", "Asado", "Argentina")
 
+    assert table_name == table
+    assert rows_inserted == expected_rows
+
+    # The created table carries exactly the payload's columns plus the pk
+    payload_columns = list(payload[table][0])
+    assert set(column_names(db_cursor, table)) == set(payload_columns) | {"id"}
 
-@pytest.mark.django_db(transaction=True)
+    # First row round-trips in payload column order; identifiers are
+    # composed with sql.Identifier rather than interpolated into the string
+    db_cursor.execute(sql.SQL("SELECT {} FROM {} ORDER BY {}").format(
+        sql.SQL(", ").join(sql.Identifier(col) for col in payload_columns),
+        sql.Identifier(table),
+        sql.Identifier("id")
+    ))
+    rows = db_cursor.fetchall()
+    assert len(rows) == expected_rows
+    assert rows[0] == first_row
+
+
+@pytest.mark.django_db
 @pytest.mark.parametrize("invalid_data,error_match", [
     ({"test-invalid": [{"col": "val"}]}, "Invalid table name"),
     ({"test_table": [{"col-name": "val"}]}, "Invalid column name"),
@@ -56,62 +70,25 @@ def test_validation_errors(invalid_data, error_match):
         service.create_or_update_dataset()
 
 
-@pytest.mark.django_db(transaction=True)
-def test_real_world_scenario_tutifruti(tutifruti_data):
-    """Test with the real-world example from the challenge."""
-    service = DatasetService(tutifruti_data)
-    table_name, rows_inserted = service.create_or_update_dataset()
-    
-    assert table_name == "tutifruti"
-    assert rows_inserted == 3
-    
-    with connection.cursor() as cursor:
-        # Verify table structure
-        cursor.execute("""
-            SELECT column_name FROM information_schema.columns 
-            WHERE table_name = 'tutifruti' 
-            AND column_name != 'id'
-            ORDER BY column_name
-        """)
-        columns = [row[0] for row in cursor.fetchall()]
-        assert set(columns) == {"letra", "comida", "pais", "nombre", "animal"}
-        
-        # Verify data count
-        cursor.execute('SELECT COUNT(*) FROM tutifruti')
-        assert cursor.fetchone()[0] == 3
-        
-        # Verify specific row
-        cursor.execute('SELECT * FROM tutifruti WHERE letra = %s', ['A'])
-        row = cursor.fetchone()
-        assert row[1] == 'A'  # letra (skipping id at index 0)
-
-
-@pytest.mark.django_db(transaction=True)
-def test_multiple_schema_evolutions():
+@pytest.mark.django_db
+def test_multiple_schema_evolutions(db_cursor, column_names):
     """Test multiple rounds of schema evolution."""
-    # Round 1: Create table
-    data1 = {"test_multi_evo": [{"col1": "val1"}]}
-    DatasetService(data1).create_or_update_dataset()
-    
-    # Round 2: Add col2
-    data2 = {"test_multi_evo": [{"col1": "val1", "col2": "val2"}]}
-    DatasetService(data2).create_or_update_dataset()
-    
-    # Round 3: Add col3
-    data3 = {"test_multi_evo": [{"col1": "val1", "col2": "val2", "col3": "val3"}]}
-    DatasetService(data3).create_or_update_dataset()
-    
+    # Each round adds one column; all rounds share the test's transaction.
+    rounds = [
+        {"col1": "val1"},
+        {"col1": "val1", "col2": "val2"},
+        {"col1": "val1", "col2": "val2", "col3": "val3"},
+    ]
+    total_inserted = 0
+    for row in rounds:
+        _, rows_inserted = DatasetService(
+            {"test_multi_evo": [row]}
+        ).create_or_update_dataset()
+        total_inserted += rows_inserted
+
     # Verify final schema
-    with connection.cursor() as cursor:
-        cursor.execute("""
-            SELECT column_name FROM information_schema.columns 
-            WHERE table_name = 'test_multi_evo' 
-            AND column_name != 'id'
-            ORDER BY column_name
-        """)
-        columns = [row[0] for row in cursor.fetchall()]
-        assert set(columns) == {"col1", "col2", "col3"}
-        
-        # Verify we have 3 rows
-        cursor.execute('SELECT COUNT(*) FROM test_multi_evo')
-        assert cursor.fetchone()[0] == 3
+    columns = column_names(db_cursor, "test_multi_evo")
+    assert set(columns) - {"id"} == {"col1", "col2", "col3"}
+
+    # One row per round; the returned counts are authoritative
+    assert total_inserted == 3
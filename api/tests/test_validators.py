@@ -0,0 +1,138 @@
+"""
+Pure-validation tests for DatasetService.
+
+These exercise the validate() phase only - no database marker, no DB
+fixtures, and no django.db import, so they run with zero database
+overhead.
+"""
+
+import re
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from api.services import DatasetService
+
+
+# Compiled once at import: pytest.raises(match=...) accepts re.Pattern, and
+# the parametrized validation tests would otherwise recompile the same
+# pattern on every iteration.
+EMPTY_REQUEST = re.compile(r"Request cannot be empty")
+EXACTLY_ONE_TABLE = re.compile(r"must contain exactly one table")
+MUST_BE_ARRAY = re.compile(r"must be an array")
+INVALID_TABLE_NAME = re.compile(r"Invalid table name")
+EMPTY_DATA = re.compile(r"cannot be empty")
+INVALID_COLUMN_NAME = re.compile(r"Invalid column name")
+MUST_BE_OBJECT = re.compile(r"must be an object")
+MISSING_COLUMNS = re.compile(r"missing columns")
+EXTRA_COLUMNS = re.compile(r"extra columns")
+INCONSISTENT_ROW = re.compile(r"Row 2 has inconsistent columns")
+NO_SHARED_COLUMNS = re.compile(r"No shared columns")
+
+
+# ===== VALIDATION TESTS =====
+
+@pytest.mark.parametrize("data,error", [
+    ({"test_table": [{"name": "John"}, {"name": "Jane"}]}, None),
+    ({}, EMPTY_REQUEST),
+    ({"table1": [{"col": "val"}], "table2": [{"col": "val"}]}, EXACTLY_ONE_TABLE),
+    ({"test_table": "not a list"}, MUST_BE_ARRAY),
+])
+def test_validate_structure(data, error):
+    """Table-driven structure validation: one happy path, three failures."""
+    service = DatasetService(data)
+
+    if error is None:
+        service._validate_structure()
+        assert service.table_name == "test_table"
+        assert len(service.data) == 2
+    else:
+        with pytest.raises(ValidationError, match=error):
+            service._validate_structure()
+
+
+@pytest.mark.parametrize("table_name", [
+    "users",
+    "user_data",
+    "Data123",
+    "TABLE_1",
+    "_leading_underscore",
+    "MixedCase_123"
+])
+def test_validate_table_name_valid(table_name):
+    """Test table name validation with valid names."""
+    data = {table_name: [{"col": "val"}]}
+    service = DatasetService(data)
+    service._validate_structure()
+    service._validate_table_name()  # Should not raise
+
+
+@pytest.mark.parametrize("table_name,reason", [
+    ("table-name", "hyphen"),
+    ("table name", "space"),
+    ("table.name", "dot"),
+    ("table@name", "special char"),
+    ("table;DROP", "SQL injection attempt"),
+    ("table()", "parentheses"),
+    ("table*", "asterisk"),
+])
+def test_validate_table_name_invalid(table_name, reason):
+    """Test table name validation fails with invalid characters."""
+    data = {table_name: [{"col": "val"}]}
+    service = DatasetService(data)
+    service._validate_structure()
+    
+    with pytest.raises(ValidationError, match=INVALID_TABLE_NAME):
+        service._validate_table_name()
+
+
+@pytest.mark.parametrize("data,error", [
+    ({"test_table": [{"name": "John"}]}, None),
+    ({"test_table": []}, EMPTY_DATA),
+])
+def test_validate_data_not_empty(data, error):
+    """Table-driven empty-data validation."""
+    service = DatasetService(data)
+    service._validate_structure()
+
+    if error is None:
+        service._validate_data_not_empty()  # Should not raise
+    else:
+        with pytest.raises(ValidationError, match=error):
+            service._validate_data_not_empty()
+
+
+@pytest.mark.parametrize("rows,error", [
+    # Valid column names and consistent rows
+    ([{"name": "John", "age_years": "30", "City123": "NYC"}], None),
+    ([{"col1": "val"}], None),
+    ([{"_underscore": "val", "num123": "val"}], None),
+    ([{"UPPERCASE": "val", "lowercase": "val"}], None),
+    ([{"name": "John", "age": "30"}, {"name": "Jane", "age": "25"}], None),
+    # Invalid column names: hyphen, space, dot, special char, asterisk,
+    # parentheses
+    ([{"col-name": "val"}], INVALID_COLUMN_NAME),
+    ([{"col name": "val"}], INVALID_COLUMN_NAME),
+    ([{"col.name": "val"}], INVALID_COLUMN_NAME),
+    ([{"col@name": "val"}], INVALID_COLUMN_NAME),
+    ([{"col*": "val"}], INVALID_COLUMN_NAME),
+    ([{"col(1)": "val"}], INVALID_COLUMN_NAME),
+    # Row is not an object
+    (["string_value"], MUST_BE_OBJECT),
+    # Inconsistent rows: missing, extra, completely different columns
+    ([{"name": "John", "age": "30"}, {"name": "Jane"}], MISSING_COLUMNS),
+    ([{"name": "John", "age": "30"},
+      {"name": "Jane", "age": "25", "city": "NYC"}], EXTRA_COLUMNS),
+    ([{"name": "John", "age": "30"},
+      {"city": "NYC", "country": "USA"}], INCONSISTENT_ROW),
+])
+def test_validate_rows(rows, error):
+    """Table-driven column-name and row-consistency validation."""
+    service = DatasetService({"test_table": rows})
+    service._validate_structure()
+
+    if error is None:
+        service._validate_rows()  # Should not raise
+    else:
+        with pytest.raises(ValidationError, match=error):
+            service._validate_rows()
@@ -82,6 +82,11 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'password'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5433'),
+        # Reuse connections across requests instead of paying TCP + auth
+        # (~3 round-trips) per request; health checks catch stale sockets
+        # before a request trips over them.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -129,6 +134,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 POSTGREST_URL = 'http://localhost:3000'
 
+# How DatasetService writes rows: 'copy' streams a single COPY FROM STDIN
+# (fastest); 'values' uses one batched INSERT ... VALUES via
+# psycopg2.extras.execute_values, for setups where COPY is undesirable
+# (e.g. row triggers or server-side type coercion).
+DATASET_INSERT_MODE = os.getenv('DATASET_INSERT_MODE', 'copy')
+
 
 LOGGING = {
     'version': 1,